@@ -0,0 +1,149 @@
+"""This file contains the numerical kernels used by the other modules.
+
+The kernels are compiled with Numba when it is installed. If Numba is not
+available, an equivalent vectorized NumPy implementation is used.
+
+Raoul Collenteur, 2025
+
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+_DUPLICATE_TIMES_MSG = (
+    "The water table contains duplicate time stamps, dh/dt cannot be computed."
+)
+
+
+def _diff_mask_div_loop(v, t, sign, units_per_day):
+    """Single pass loop computing dh/dt for the sections with the requested sign."""
+    n = v.size - 1
+    out_vals = np.empty(n)
+    out_idx = np.empty(n, np.int64)
+    k = 0
+    for i in range(n):
+        dh = v[i + 1] - v[i]
+        if dh * sign > 0:
+            dt = t[i + 1] - t[i]
+            if dt == 0:
+                raise ValueError(_DUPLICATE_TIMES_MSG)
+            out_vals[k] = dh * units_per_day / dt
+            out_idx[k] = i + 1
+            k += 1
+    return out_vals[:k], out_idx[:k]
+
+
+def _diff_mask_div_numpy(v, t, sign, units_per_day):
+    """Vectorized NumPy implementation of the dh/dt kernel."""
+    dh = v[1:] - v[:-1]
+    idx = np.flatnonzero(dh * sign > 0)
+    dt = t[idx + 1] - t[idx]
+    if (dt == 0).any():
+        raise ValueError(_DUPLICATE_TIMES_MSG)
+    out_vals = dh[idx] * units_per_day / dt
+    return out_vals, idx + 1
+
+
+def _compute_rises_loop(v, left_pos, right_pos, a, b):
+    """Single pass loop computing the positive rises over the MCR extrapolation."""
+    n = left_pos.size
+    out_vals = np.empty(n)
+    out_idx = np.empty(n, np.int64)
+    k = 0
+    for i in range(n):
+        h0 = v[left_pos[i]]
+        rise = v[right_pos[i]] - (h0 + (b - a * h0))
+        if rise > 0:
+            out_vals[k] = rise
+            out_idx[k] = i
+            k += 1
+    return out_vals[:k], out_idx[:k]
+
+
+def _compute_rises_numpy(v, left_pos, right_pos, a, b):
+    """Vectorized NumPy implementation of the rises kernel."""
+    h0 = v[left_pos]
+    rise = v[right_pos] - (h0 + (b - a * h0))
+    idx = np.flatnonzero(rise > 0)
+    return rise[idx], idx
+
+
+if njit is not None:
+    _diff_mask_div = njit(cache=True)(_diff_mask_div_loop)
+    _compute_rises = njit(cache=True)(_compute_rises_loop)
+else:  # pragma: no cover
+    _diff_mask_div = _diff_mask_div_numpy
+    _compute_rises = _compute_rises_numpy
+
+
+def diff_mask_div(values, times, sign):
+    """Compute dh/dt for the sections where dh has the requested sign.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Array with the water table values.
+    times : pandas.DatetimeIndex
+        Index with the times of the water table values, with or without a time zone.
+    sign : int
+        Use -1 to get the falling sections and 1 to get the rising sections.
+
+    Returns
+    -------
+    out_vals : numpy.ndarray
+        Array with the dh/dt values in units per day.
+    out_idx : numpy.ndarray
+        Array with the positions of the right side of each section.
+
+    """
+    # The integer times are in the unit of the index, which may differ from ns
+    units_per_day = np.timedelta64(1, "D") / np.timedelta64(1, times.unit)
+    return _diff_mask_div(
+        np.ascontiguousarray(values, dtype=np.float64),
+        times.asi8,
+        sign,
+        units_per_day,
+    )
+
+
+def compute_rises(values, left_pos, right_pos, a=0.0, b=0.0):
+    """Compute the positive rises of the water table over a set of sections.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Array with the water table values.
+    left_pos : numpy.ndarray
+        Array with the positions of the start of the sections.
+    right_pos : numpy.ndarray
+        Array with the positions of the end of the sections.
+    a : float, optional
+        Parameter a of the MCR, by default 0.0.
+    b : float, optional
+        Parameter b of the MCR, by default 0.0.
+
+    Returns
+    -------
+    out_vals : numpy.ndarray
+        Array with the positive rises.
+    out_idx : numpy.ndarray
+        Array with the positions of the sections with a positive rise.
+
+    Notes
+    -----
+    The rise is computed as the water table at the end of a section minus the water
+    table at the start extrapolated with the MCR. With a and b equal to zero, the
+    rise is the change of the water table over the section.
+
+    """
+    return _compute_rises(
+        np.ascontiguousarray(values, dtype=np.float64),
+        np.ascontiguousarray(left_pos, dtype=np.int64),
+        np.ascontiguousarray(right_pos, dtype=np.int64),
+        float(a),
+        float(b),
+    )
@@ -4,6 +4,9 @@ Author: Raoul A. Collenteur, July 2025
 
 """
 
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 
 
@@ -20,12 +23,67 @@ def validate_data(wt):
     ValueError
         If the data is not a Pandas Series or if the index is not a DatetimeIndex.
 
+    Notes
+    -----
+    Only the check that the data is a Pandas Series is always performed. The other
+    checks are skipped when Python runs with optimizations enabled (python -O).
+    Invalid data then fails later in the computations, with less clear errors.
+
     """
     if not isinstance(wt, pd.Series):
         raise ValueError("The data should be a Pandas Series.")
 
-    if not isinstance(wt.index, pd.DatetimeIndex):
-        raise ValueError("The index of the data should be a DatetimeIndex.")
+    if __debug__:
+        if not isinstance(wt.index, pd.DatetimeIndex):
+            raise ValueError("The index of the data should be a DatetimeIndex.")
+
+        if wt.empty:
+            raise ValueError(
+                "The data is empty. Please provide a non-empty Pandas Series."
+            )
+
+
+@dataclass
+class _Events:
+    """Internal container with the positions and values of a set of sections.
+
+    Parameters
+    ----------
+    times : pandas.DatetimeIndex
+        Index with the times of the water table.
+    left_pos : numpy.ndarray
+        Array with the positions of the start of the sections in the water table.
+    right_pos : numpy.ndarray
+        Array with the positions of the end of the sections in the water table.
+    values : numpy.ndarray
+        Array with the values of each section, e.g., the change of the water table.
+
+    Notes
+    -----
+    The arrays are used directly in the computations. The times of the bounds and
+    the pandas objects are only created when needed for the public API.
+
+    """
+
+    times: pd.DatetimeIndex
+    left_pos: np.ndarray
+    right_pos: np.ndarray
+    values: np.ndarray
+
+    @property
+    def left(self) -> pd.DatetimeIndex:
+        """Index with the start times of the sections."""
+        return self.times[self.left_pos]
+
+    @property
+    def right(self) -> pd.DatetimeIndex:
+        """Index with the end times of the sections."""
+        return self.times[self.right_pos]
+
+    def to_interval_index(self) -> pd.IntervalIndex:
+        """Convert the bounds of the sections to a pandas IntervalIndex."""
+        return pd.IntervalIndex.from_arrays(left=self.left, right=self.right)
 
-    if wt.empty:
-        raise ValueError("The data is empty. Please provide a non-empty Pandas Series.")
+    def to_series(self, name=None) -> pd.Series:
+        """Convert the sections to a pandas Series with an IntervalIndex."""
+        return pd.Series(self.values, index=self.to_interval_index(), name=name)
@@ -4,8 +4,10 @@ Raoul Collenteur, 2025
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
 from pandas import DataFrame, IntervalIndex, Series
-from scipy.optimize import curve_fit
+
+from ._kernels import diff_mask_div
 
 
 class MCR:
@@ -50,18 +52,14 @@ class MCR:
         pd.DataFrame
             DataFrame with the fall sections of the water table fluctuations.
         """
-        dt = wt.index.diff()[1:]
-        dh = wt.diff()[1:]
-
-        # Create an IntervalIndex for which the rises are computed
-        dtint = IntervalIndex.from_arrays(left=dh.index - dt, right=dh.index)
+        times = wt.index
+        dh = np.diff(wt.to_numpy())
 
-        changes = DataFrame(index=dtint, data=dh.values)
+        # Only keep the falls that are negative, before building the intervals
+        pos = np.flatnonzero(dh < 0)
+        dtint = IntervalIndex.from_arrays(left=times[pos], right=times[pos + 1])
 
-        # Only keep the falls that are negative
-        fall_sections = changes[changes.values < 0]
-
-        return fall_sections
+        return DataFrame(index=dtint, data=dh[pos])
 
     def get_dhdt(self, wt: Series) -> Series:
         """Get the dh/dt values from the water table fluctuations.
@@ -82,25 +80,21 @@ class MCR:
         fluctuations.
 
         """
-        # Compute the time differences in days
-        dt = wt.index.diff()[1:].total_seconds() / (3600 * 24)
-
-        # Compute the differences in water table
-        dh = wt.diff()[1:]
+        dhdt, idx = self._get_dhdt(wt)
+        return Series(dhdt, index=wt.index[idx])
 
-        # Compute dh/dt
-        dhdt = dh / dt
-        dhdt.index = dh.index
-
-        return dhdt[dhdt < 0]
+    def _get_dhdt(self, wt: Series):
+        """Internal method to get the dh/dt values and their positions in wt."""
+        # Compute dh/dt in a single pass, keeping only the falls
+        return diff_mask_div(wt.to_numpy(), wt.index, sign=-1)
 
     def estimate_dhdt(self, wt, a=None, b=None):
         """estimate_dhdt from parameters and the water table
 
         Parameters
         ----------
-        wt : pd.Series
-            Time series of the water table fluctuations.
+        wt : pd.Series or numpy.ndarray
+            Time series or array of the water table fluctuations.
         a : float, optional
             Parameter a of the MCR, by default None
         b : float, optional
@@ -108,18 +102,21 @@ class MCR:
 
         Returns
         -------
-        pd.Series
-            Series with the estimated dh/dt values of the water table fluctuations.
+        pd.Series or numpy.ndarray
+            Estimated dh/dt values of the water table fluctuations, of the same type
+            as wt.
 
         Notes
         -----
         If a and b are not provided, the optimal parameters from the fit are used.
+        Passing a numpy.ndarray avoids the overhead of the pandas arithmetic, which
+        is preferred for internal use.
 
         """
         if a is None or b is None:
             a, b = self.parameters.optimal.values
 
-        dhdt_est = -a * wt + b
+        dhdt_est = b - a * wt
         return dhdt_est
 
     def fit_mcr(self, wt: Series):
@@ -136,17 +133,39 @@ class MCR:
 
         Notes
         -----
-        This method is not implemented yet.
+        As the MCR is linear in the parameters a and b, the parameters are
+        estimated by linear least squares on the falling sections. The standard
+        errors are computed from the covariance matrix of the estimates.
         """
-        # Fit the MCR to the water table data using curve_fit
-        dhdt = self.get_dhdt(wt)
-        self.dhdt = dhdt
-        popt, pcov = curve_fit(
-            f=self.estimate_dhdt, xdata=wt.loc[dhdt.index], ydata=dhdt
-        )
-
-        self.parameters.optimal = popt
-        self.parameters.stderr = pcov.diagonal() ** 0.5
+        dhdt, idx = self._get_dhdt(wt)
+        self.dhdt = Series(dhdt, index=wt.index[idx])
+
+        n = dhdt.size
+        if n < self.nparam:
+            raise ValueError(
+                "Not enough falling sections in the water table data to fit the MCR."
+            )
+
+        # The MCR is linear in a and b, so it is fitted by linear least squares
+        h = wt.to_numpy()[idx]
+        y = dhdt
+        x = np.column_stack([-h, np.ones_like(h)])
+        popt, *_ = np.linalg.lstsq(x, y, rcond=None)
+
+        # Estimate the covariance matrix of the parameters from the residuals. If it
+        # cannot be estimated (e.g., an exact fit or all heads equal), the errors
+        # are infinite.
+        pcov = np.full((self.nparam, self.nparam), np.inf)
+        if n > self.nparam:
+            r = y - x @ popt
+            sigma2 = (r @ r) / (n - self.nparam)
+            try:
+                pcov = sigma2 * np.linalg.inv(x.T @ x)
+            except np.linalg.LinAlgError:
+                pass
+
+        self.parameters["optimal"] = popt
+        self.parameters["stderr"] = np.sqrt(pcov.diagonal())
 
     def get_extrapolated(self, wt: Series, events: IntervalIndex, p=None) -> Series:
         """Internal method to get the extrapolated values using the MCR.
@@ -169,20 +188,39 @@ class MCR:
         """
         if p is None:
             a, b = self.parameters.optimal.values
-
-        recession = self.estimate_dhdt(wt[events.left], a, b)
-        return wt[events.left] + recession.values
+        else:
+            a, b = p
+
+        # Look up the water table at the start of the events by position
+        pos = wt.index.get_indexer(events.left)
+        if (pos == -1).any():
+            missing = events.left[pos == -1]
+            raise KeyError(
+                f"The start of the events {list(missing)} are not in the index of "
+                "the water table."
+            )
+        left = wt.to_numpy()[pos]
+
+        recession = self.estimate_dhdt(left, a, b)
+        return Series(left + recession, index=events.left, name=wt.name)
 
     def plot(self, wt) -> plt.Axes:
         """Plot the fittedmaster recession curve for diagnostic checking."""
         _, ax = plt.subplots(figsize=(6, 4))
 
-        dhdt_est = self.estimate_dhdt(wt.loc[self.dhdt.index])
-
-        plt.plot(
-            wt.loc[self.dhdt.index], -self.dhdt, marker=".", linestyle=" ", color="k"
-        )
-        plt.plot(wt.loc[self.dhdt.index], -dhdt_est, color="C1")
+        # Look up the water table at the falls by position
+        pos = wt.index.get_indexer(self.dhdt.index)
+        if (pos == -1).any():
+            missing = self.dhdt.index[pos == -1]
+            raise KeyError(
+                f"The times of the falls {list(missing)} are not in the index of "
+                "the water table."
+            )
+        h = wt.to_numpy()[pos]
+        dhdt_est = self.estimate_dhdt(h)
+
+        plt.plot(h, -self.dhdt.to_numpy(), marker=".", linestyle=" ", color="k")
+        plt.plot(h, -dhdt_est, color="C1")
 
         ax.set_xlabel("Water table (m asl)")
         ax.set_ylabel("$-dh/dt$ [L/T]")
@@ -5,10 +5,22 @@ Raoul Collenteur, 2025
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
 from numpy import nan
-from pandas import DataFrame, IntervalIndex, Series
+from pandas import DataFrame, Series
 
-from .core import validate_data
+from ._kernels import compute_rises
+from .core import _Events, validate_data
+
+# Valid options for the rise_rule argument
+_RISE_RULES = frozenset({"both", "rises"})
+
+# Default parameters of the model, copied for each new model instance
+_PARAMETERS = DataFrame(
+    index=["sy"],
+    data=[[0.1, 0.1, 0.005]],
+    columns=["initial", "optimal", "stderr"],
+)
 
 
 class Model:
@@ -38,7 +50,43 @@ class Model:
 
         """
         validate_data(wt)
-        self.wt = wt.dropna()
+        self._initialize(wt.dropna(), name=name, mcr=mcr)
+
+    @classmethod
+    def from_validated(cls, wt, name=None, mcr=None):
+        """Create a Model from water table data that is already validated.
+
+        Parameters
+        ----------
+        wt : pd.Series
+            Time series of the water table fluctuations without missing values. The
+            index should be a sorted DatetimeIndex.
+        name : str, optional
+            Name of the model, by default None
+        mcr : MCR instance, optional
+            Instance of the MCR class to use for extrapolation of the water table
+            before computing the rises, by default None
+
+        Returns
+        -------
+        Model
+            Model instance for the water table data.
+
+        Notes
+        -----
+        This constructor skips the validation of the data and the removal of the
+        missing values, which is useful when many models are created for the same
+        data (e.g., for an uncertainty analysis). It is the responsibility of the
+        user to make sure the data meets the requirements.
+
+        """
+        model = cls.__new__(cls)
+        model._initialize(wt, name=name, mcr=mcr)
+        return model
+
+    def _initialize(self, wt, name=None, mcr=None):
+        """Internal method to set the attributes of the model."""
+        self.wt = wt
         self.name = name
 
         # Settings dict
@@ -47,15 +95,30 @@ class Model:
             "use_mcr": None,  # None means use MCR when available
         }
 
-        self.parameters = DataFrame(
-            index=["sy"],
-            data=[[0.1, 0.1, 0.005]],
-            columns=["initial", "optimal", "stderr"],
-        )
+        self.parameters = _PARAMETERS.copy()
 
         self.filter = None
         self.mcr = mcr
-        self.events = None
+        self._events = None
+        self._events_int = None
+        self._rises = None
+        self._rises_series = None
+        self._recharge = None
+
+    @property
+    def wt(self):
+        """pandas.Series with the water table fluctuations used by the model."""
+        return self._wt
+
+    @wt.setter
+    def wt(self, wt):
+        self._wt = wt
+        # The events, rises and recharge belong to the previous water table
+        self._events = None
+        self._events_int = None
+        self._rises = None
+        self._rises_series = None
+        self._recharge = None
 
     def fit_mcr(self, tmin=None, tmax=None):
         """Method to fit the Master Recession Curve (MCR).
@@ -89,46 +152,124 @@ class Model:
 
         self.mcr.fit_mcr(wt_fit)
 
-    def get_recharge_event_intervals(self, wt: Series, rise_rule="rises") -> Series:
-        """Method to get the intervals on which to compute the recharge.
+    def _get_events(self, wt: Series, rise_rule="rises") -> _Events:
+        """Internal method to get the sections on which to compute the recharge.
 
         Parameters
         ----------
         wt : pd.Series
             Time series of the water table fluctuations.
+        rise_rule : str, optional
+            Use "rises" to get only the rise sections or "both" to get every section,
+            by default "rises".
 
         Returns
         -------
-        pd.IntervalIndex
-            IntervalIndex with the events to compute the recharge on.
+        _Events
+            Events with the bounds and water table changes of the sections.
 
         """
-        dt = wt.index.diff()[1:]
-        dh = wt.diff()[1:]
-
-        # Create an IntervalIndex for which the rises are computed
-        dtint = IntervalIndex.from_arrays(left=dh.index - dt, right=dh.index)
-
-        changes = Series(index=dtint, data=dh.values)
-
         # 1. Get the points for which to consider the rises
-        if rise_rule not in ["both", "rises"]:
+        if rise_rule not in _RISE_RULES:
             raise ValueError("rise_rule should be 'both' or 'rises'.")
 
-        # Get only the rise sections
+        times = wt.index
+        dh = np.diff(wt.to_numpy())
+
+        # Get the positions of only the rise sections
         if rise_rule == "rises":
-            events_int = changes[changes.values > 0].index
+            pos = np.flatnonzero(dh > 0)
         # Get every point
         elif rise_rule == "both":
-            events_int = changes.index
+            pos = np.arange(dh.size)
+
+        events = _Events(times=times, left_pos=pos, right_pos=pos + 1, values=dh[pos])
 
-        if events_int is None or events_int.empty:
+        if events.values.size == 0:
             raise ValueError(
                 "No recharge events found. Please check the water table "
                 "data and the rise_method."
             )
-        self.events = events_int
-        return events_int
+        return events
+
+    def get_recharge_event_intervals(self, wt: Series, rise_rule="rises") -> Series:
+        """Method to get the intervals on which to compute the recharge.
+
+        Parameters
+        ----------
+        wt : pd.Series
+            Time series of the water table fluctuations.
+
+        Returns
+        -------
+        pd.IntervalIndex
+            IntervalIndex with the events to compute the recharge on.
+
+        """
+        self._events = self._get_events(wt, rise_rule=rise_rule)
+        self._events_int = None
+        return self.events
+
+    def _to_events(self, intervals, values=None) -> _Events:
+        """Internal method to convert an IntervalIndex on the water table to _Events.
+
+        Parameters
+        ----------
+        intervals : pd.IntervalIndex
+            IntervalIndex with bounds that are in the index of the water table.
+        values : array_like, optional
+            Values of each interval. If None, the change of the water table over
+            each interval is used.
+
+        Returns
+        -------
+        _Events
+            Events with the positions and values of the intervals.
+
+        """
+        left_pos = self.wt.index.get_indexer(intervals.left)
+        right_pos = self.wt.index.get_indexer(intervals.right)
+        if (left_pos == -1).any() or (right_pos == -1).any():
+            raise KeyError(
+                "The bounds of the intervals should be in the index of the water table."
+            )
+        if values is None:
+            h = self.wt.to_numpy()
+            values = h[right_pos] - h[left_pos]
+        return _Events(
+            times=self.wt.index,
+            left_pos=left_pos,
+            right_pos=right_pos,
+            values=np.asarray(values, dtype=float),
+        )
+
+    @property
+    def events(self):
+        """pandas.IntervalIndex with the events from the last call to
+        get_recharge_event_intervals or estimate_recharge."""
+        if self._events_int is None and self._events is not None:
+            self._events_int = self._events.to_interval_index()
+        return self._events_int
+
+    @events.setter
+    def events(self, events):
+        self._events = None if events is None else self._to_events(events)
+        self._events_int = events
+
+    @property
+    def rises(self):
+        """pandas.Series with the rises of the last recharge estimate."""
+        if self._rises_series is None and self._rises is not None:
+            self._rises_series = self._rises.to_series()
+        return self._rises_series
+
+    @rises.setter
+    def rises(self, rises):
+        if rises is None:
+            self._rises = None
+        else:
+            self._rises = self._to_events(rises.index, rises.to_numpy())
+        self._rises_series = rises
 
     def estimate_recharge(self, sy=None, fit_mcr=False, rise_rule="rises") -> Series:
         """Method to estimate the groundwater recharge.
@@ -164,24 +305,27 @@ class Model:
             self.fit_mcr()
 
         # 2. Get the points for which to consider the rises
-        events_int = self.get_recharge_event_intervals(self.wt, rise_rule=rise_rule)
+        events = self._get_events(self.wt, rise_rule=rise_rule)
 
-        # 3. Compute the rises
+        # 3. Compute the rises, extrapolating the water table with the MCR if present
         if self.mcr is not None:
-            # 3. Extrapolate using the MCR
-            left_hand = self.mcr.get_extrapolated(self.wt, events_int)
-
+            a, b = self.mcr.parameters.optimal.values
         else:
-            left_hand = Series(index=events_int.left, data=self.wt[events_int.left])
+            a, b = 0.0, 0.0
 
-        #
-        rises = Series(
-            index=events_int,
-            data=self.wt[events_int.right].values - left_hand.values,
+        rises, idx = compute_rises(
+            self.wt.to_numpy(), events.left_pos, events.right_pos, a, b
         )
 
-        rises = rises[rises.values > 0]
-        self.rises = rises
+        self._events = events
+        self._events_int = None
+        self._rises = _Events(
+            times=events.times,
+            left_pos=events.left_pos[idx],
+            right_pos=events.right_pos[idx],
+            values=rises,
+        )
+        self._rises_series = None
 
         if sy is None:
             if self.parameters.loc["sy", "optimal"] is nan:
@@ -196,15 +340,17 @@ class Model:
             self.parameters.loc["sy", "optimal"] = sy
 
         # 3. Compute the recharge as the product of the events and the specific yield
-        recharge = rises * sy
+        recharge = self._rises.values * sy
 
-        # Set the index to the right side of the intervals
-        recharge.index = rises.index.right
-        recharge.name = "recharge"
+        # Clip negative values to zero, in place on the new array
+        np.maximum(recharge, 0.0, out=recharge)
 
-        # Clip negative values to zero
-        recharge[recharge < 0] = 0
+        # Set the index to the right side of the intervals
+        recharge = Series(
+            recharge, index=self._rises.right.rename(None), name="recharge"
+        )
 
+        self._recharge = recharge
         return recharge
 
     def plot(self, ax=None, figsize=(10, 6)):
@@ -229,20 +375,26 @@ class Model:
         # Plot the water table
         self.wt.plot(ax=axs[0], label="Water table", marker=".", ls="none", color="k")
 
-        # Plot the rises
-        if self.events is not None:
-            for interval, rise in self.rises.items():
-                axs[0].plot(
-                    [interval.left, interval.right],
-                    [self.wt.loc[interval.left], self.wt.loc[interval.left] + rise],
-                    lw=3,
-                    label="Rises",
-                    color="C1",
-                )
+        # Plot the rises as one line, with the segments separated by NaN values
+        if self._rises is not None:
+            rises = self._rises
+            left = self.wt.to_numpy()[rises.left_pos]
+            n = rises.values.size
+            # Positions of the segment bounds, with -1 taken as NaT between segments
+            pos = np.full(3 * n, -1)
+            pos[0::3] = rises.left_pos
+            pos[1::3] = rises.right_pos
+            x = rises.times.take(pos, allow_fill=True, fill_value=None)
+            y = np.full(3 * n, np.nan)
+            y[0::3] = left
+            y[1::3] = left + rises.values
+            axs[0].plot(x, y, lw=3, label="Rises", color="C1")
 
         # Plot the recharge
-        if self.events is not None:
-            self.estimate_recharge().plot(ax=axs[1], label="Recharge")
+        if self._events is not None:
+            if self._recharge is None:
+                self.estimate_recharge()
+            self._recharge.plot(ax=axs[1], label="Recharge")
 
         axs[0].set_ylabel("Water table [m]")
         axs[0].legend(["Water table", "Rises"])
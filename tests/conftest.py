@@ -1,17 +1,25 @@
-import pytest
-import pandas as pd
+from functools import cache
+
 import numpy as np
+import pandas as pd
+import pytest
+
+
+@cache
+def _daterange(start, periods, freq):
+    # DatetimeIndex objects are immutable, so they can be shared between fixtures
+    return pd.date_range(start, periods=periods, freq=freq)
 
 
 @pytest.fixture
 def valid_series():
-    idx = pd.date_range("2020-01-01", periods=10, freq="D")
+    idx = _daterange("2020-01-01", 10, "D")
     return pd.Series(np.random.rand(10), index=idx)
 
 
 @pytest.fixture
 def empty_series():
-    idx = pd.date_range("2020-01-01", periods=0, freq="D")
+    idx = _daterange("2020-01-01", 0, "D")
     return pd.Series([], index=idx)
 
 
@@ -1,6 +1,8 @@
+import numpy as np
+import pandas as pd
 import pytest
 
-from gwtf.core import validate_data
+from gwtf.core import _Events, validate_data
 
 
 def test_validate_data_valid(valid_series):
@@ -13,11 +15,27 @@ def test_validate_data_not_series(not_a_series):
         validate_data(not_a_series)
 
 
+@pytest.mark.skipif(not __debug__, reason="The check is skipped with python -O")
 def test_validate_data_non_datetime_index(non_datetime_index_series):
     with pytest.raises(ValueError, match="DatetimeIndex"):
         validate_data(non_datetime_index_series)
 
 
+@pytest.mark.skipif(not __debug__, reason="The check is skipped with python -O")
 def test_validate_data_empty(empty_series):
     with pytest.raises(ValueError, match="empty"):
         validate_data(empty_series)
+
+
+def test_events_to_interval_index():
+    times = pd.date_range("2020-01-01", periods=3, freq="D")
+    events = _Events(
+        times=times,
+        left_pos=np.array([0, 1]),
+        right_pos=np.array([1, 2]),
+        values=np.array([1.0, 2.0]),
+    )
+    intervals = events.to_interval_index()
+    assert isinstance(intervals, pd.IntervalIndex)
+    assert (intervals.left == times[:-1]).all()
+    assert (intervals.right == times[1:]).all()
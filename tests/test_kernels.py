@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from gwtf._kernels import (
+    _compute_rises_loop,
+    _compute_rises_numpy,
+    _diff_mask_div_loop,
+    _diff_mask_div_numpy,
+    compute_rises,
+    diff_mask_div,
+)
+
+
+@pytest.fixture
+def arrays():
+    rng = np.random.default_rng(0)
+    v = rng.normal(size=50).cumsum()
+    t = np.sort(rng.choice(1000, size=50, replace=False)).astype(np.int64)
+    return v, t
+
+
+@pytest.mark.parametrize("sign", [-1, 1])
+def test_diff_mask_div_implementations_agree(arrays, sign):
+    v, t = arrays
+    vals_loop, idx_loop = _diff_mask_div_loop(v, t, sign, 1.0)
+    vals_np, idx_np = _diff_mask_div_numpy(v, t, sign, 1.0)
+    np.testing.assert_allclose(vals_loop, vals_np)
+    np.testing.assert_array_equal(idx_loop, idx_np)
+
+
+def test_diff_mask_div_units():
+    times = pd.date_range("2020-01-01", periods=4, freq="6h")
+    values = np.array([1.0, 0.5, 0.75, 0.0])
+    dhdt, idx = diff_mask_div(values, times, sign=-1)
+    np.testing.assert_allclose(dhdt, [-2.0, -3.0])
+    np.testing.assert_array_equal(idx, [1, 3])
+
+
+def test_compute_rises_implementations_agree(arrays):
+    v, _ = arrays
+    left_pos = np.arange(v.size - 1)
+    right_pos = left_pos + 1
+    vals_loop, idx_loop = _compute_rises_loop(v, left_pos, right_pos, 0.1, 0.05)
+    vals_np, idx_np = _compute_rises_numpy(v, left_pos, right_pos, 0.1, 0.05)
+    np.testing.assert_allclose(vals_loop, vals_np)
+    np.testing.assert_array_equal(idx_loop, idx_np)
+
+
+def test_compute_rises_without_mcr():
+    values = np.array([1.0, 2.0, 1.5, 1.75])
+    rises, idx = compute_rises(values, np.array([0, 1, 2]), np.array([1, 2, 3]))
+    np.testing.assert_allclose(rises, [1.0, 0.25])
+    np.testing.assert_array_equal(idx, [0, 2])
+
+
+@pytest.mark.parametrize("kernel", [_diff_mask_div_loop, _diff_mask_div_numpy])
+def test_diff_mask_div_duplicate_times(kernel):
+    v = np.array([2.0, 1.0, 0.5])
+    t = np.array([0, 1, 1], dtype=np.int64)
+    with pytest.raises(ValueError, match="duplicate time stamps"):
+        kernel(v, t, -1, 1.0)
+
+
+def test_diff_mask_div_duplicate_times_compiled():
+    times = pd.DatetimeIndex(["2020-01-01", "2020-01-02", "2020-01-02"])
+    with pytest.raises(ValueError, match="duplicate time stamps"):
+        diff_mask_div(np.array([2.0, 1.0, 0.5]), times, sign=-1)
@@ -24,12 +24,47 @@ def test_get_fall_sections(simple_wt):
     assert isinstance(falls, pd.DataFrame)
 
 
+def test_get_fall_sections_only_falls():
+    idx = pd.date_range("2020-01-01", periods=5, freq="D")
+    wt = pd.Series([10.0, 9.0, 9.5, 9.2, 9.2], index=idx)
+    falls = MCR().get_fall_sections(wt)
+    assert len(falls) == 2
+    assert (falls.values < 0).all()
+    assert falls.index[0].left == idx[0]
+    assert falls.index[1].right == idx[3]
+
+
+def test_get_fall_sections_after_inplace_edit():
+    idx = pd.date_range("2020-01-01", periods=6, freq="D")
+    wt = pd.Series([5.0, 4.0, 3.0, 2.0, 1.0, 0.0], index=idx)
+    mcr = MCR()
+    assert len(mcr.get_fall_sections(wt)) == 5
+    wt[:] = np.arange(6.0)
+    assert len(mcr.get_fall_sections(wt)) == 0
+
+
 def test_get_dhdt(simple_wt):
     mcr = MCR()
     dhdt = mcr.get_dhdt(simple_wt)
     assert isinstance(dhdt, pd.Series)
 
 
+def test_get_dhdt_per_day():
+    idx = pd.date_range("2020-01-01", periods=4, freq="12h")
+    wt = pd.Series([5.0, 4.0, 4.5, 4.0], index=idx)
+    dhdt = MCR().get_dhdt(wt)
+    np.testing.assert_allclose(dhdt.values, [-2.0, -1.0])
+    assert (dhdt.index == idx[[1, 3]]).all()
+
+
+def test_get_dhdt_tz_aware():
+    idx = pd.date_range("2020-01-01", periods=4, freq="12h", tz="Europe/Vienna")
+    wt = pd.Series([5.0, 4.0, 4.5, 4.0], index=idx)
+    dhdt = MCR().get_dhdt(wt)
+    np.testing.assert_allclose(dhdt.values, [-2.0, -1.0])
+    assert (dhdt.index == idx[[1, 3]]).all()
+
+
 def test_estimate_dhdt(simple_wt):
     mcr = MCR()
     # Set parameters for test
@@ -38,6 +73,13 @@ def test_estimate_dhdt(simple_wt):
     assert isinstance(dhdt_est, pd.Series)
 
 
+def test_estimate_dhdt_array():
+    mcr = MCR()
+    dhdt_est = mcr.estimate_dhdt(np.array([1.0, 2.0]), a=0.1, b=0.2)
+    assert isinstance(dhdt_est, np.ndarray)
+    np.testing.assert_allclose(dhdt_est, [0.1, 0.0])
+
+
 def test_fit_mcr_raises(simple_wt):
     mcr = MCR()
     # Test should raise an error
@@ -45,6 +87,45 @@ def test_fit_mcr_raises(simple_wt):
         mcr.fit_mcr(simple_wt)
 
 
+def test_fit_mcr_recovers_parameters():
+    idx = pd.date_range("2020-01-01", periods=30, freq="D")
+    h = np.empty(30)
+    h[0] = 15.0
+    for i in range(1, 30):
+        h[i] = (h[i - 1] + 1.0) / 1.1
+    wt = pd.Series(h, index=idx)
+
+    mcr = MCR()
+    mcr.fit_mcr(wt)
+    np.testing.assert_allclose(mcr.parameters.optimal.values, [0.1, 1.0])
+
+
+def test_fit_mcr_tz_aware():
+    idx = pd.date_range("2020-01-01", periods=40, freq="D", tz="Europe/Vienna")
+    wt = pd.Series(np.sin(np.linspace(0, 4 * np.pi, 40)) + 15, index=idx)
+    mcr = MCR()
+    mcr.fit_mcr(wt)
+    assert np.isfinite(mcr.parameters.optimal.values).all()
+    assert mcr.plot(wt) is not None
+
+
+def test_fit_mcr_singular():
+    idx = pd.date_range("2020-01-01", periods=10, freq="D")
+    wt = pd.Series([5.0, 4.0] * 5, index=idx)
+    mcr = MCR()
+    mcr.fit_mcr(wt)
+    assert np.isinf(mcr.parameters.stderr.values).all()
+
+
+def test_fit_mcr_two_falls():
+    idx = pd.date_range("2020-01-01", periods=4, freq="D")
+    wt = pd.Series([5.0, 4.0, 6.0, 4.5], index=idx)
+    mcr = MCR()
+    mcr.fit_mcr(wt)
+    np.testing.assert_allclose(mcr.parameters.optimal.values, [1.0, 3.0])
+    assert np.isinf(mcr.parameters.stderr.values).all()
+
+
 def test_get_extrapolated(simple_wt):
     mcr = MCR()
     mcr.parameters.loc[:, "optimal"] = [0.1, 0.2]
@@ -55,6 +136,16 @@ def test_get_extrapolated(simple_wt):
     events = IntervalIndex.from_arrays(left=idx - pd.Timedelta(days=1), right=idx)
     result = mcr.get_extrapolated(simple_wt, events)
     assert isinstance(result, pd.Series)
+    left = simple_wt[events.left]
+    np.testing.assert_allclose(result.values, left.values - 0.1 * left.values + 0.2)
+
+
+def test_get_extrapolated_missing_bound(simple_wt):
+    mcr = MCR()
+    left = pd.DatetimeIndex(["2020-01-03 12:00"])
+    events = pd.IntervalIndex.from_arrays(left=left, right=left + pd.Timedelta("1D"))
+    with pytest.raises(KeyError):
+        mcr.get_extrapolated(simple_wt, events)
 
 
 def test_plot_runs(simple_wt):
@@ -67,3 +158,12 @@ def test_plot_runs(simple_wt):
     mcr.fit_mcr(varied_wt)
     ax = mcr.plot(varied_wt)
     assert ax is not None
+
+
+def test_plot_missing_falls():
+    idx = pd.date_range("2020-01-01", periods=40, freq="D")
+    wt = pd.Series(np.sin(np.linspace(0, 4 * np.pi, 40)) + 15, index=idx)
+    mcr = MCR()
+    mcr.fit_mcr(wt)
+    with pytest.raises(KeyError):
+        mcr.plot(wt.iloc[:20])
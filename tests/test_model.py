@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from gwtf.mcr import MCR
 from gwtf.model import Model
 
 
@@ -51,3 +52,91 @@ def test_plot_runs(simple_wt):
     m.estimate_recharge(sy=0.1)
     axs = m.plot()
     assert axs is not None
+
+
+def test_plot_reuses_recharge(simple_wt, monkeypatch):
+    m = Model(simple_wt)
+    m.estimate_recharge(sy=0.1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("estimate_recharge should not be called again")
+
+    monkeypatch.setattr(m, "estimate_recharge", fail)
+    axs = m.plot()
+    assert axs is not None
+
+
+def test_from_validated(simple_wt):
+    m = Model.from_validated(simple_wt, name="test")
+    assert m.name == "test"
+    assert m.wt is simple_wt
+    pd.testing.assert_frame_equal(m.parameters, Model(simple_wt).parameters)
+    recharge = m.estimate_recharge(sy=0.1)
+    assert isinstance(recharge, pd.Series)
+
+
+def test_fit_mcr_period():
+    idx = pd.date_range("2020-01-01", periods=40, freq="D")
+    wt = pd.Series(np.sin(np.linspace(0, 4 * np.pi, 40)) + 15, index=idx)
+    m = Model(wt, mcr=MCR())
+    m.fit_mcr(tmin=idx[5], tmax=idx[30])
+    assert m.mcr.dhdt.index.min() > idx[5]
+    assert m.mcr.dhdt.index.max() <= idx[30]
+
+
+def test_plot_tz_aware():
+    idx = pd.date_range("2020-01-01", periods=40, freq="D", tz="Europe/Vienna")
+    wt = pd.Series(np.sin(np.linspace(0, 4 * np.pi, 40)) + 15, index=idx)
+    m = Model(wt, mcr=MCR())
+    recharge = m.estimate_recharge(sy=0.1, fit_mcr=True)
+    assert recharge.index.tz is not None
+    axs = m.plot()
+    assert axs is not None
+
+
+def test_set_wt_refreshes_cache(simple_wt):
+    m = Model(simple_wt)
+    idx = pd.date_range("2021-01-01", periods=5, freq="D")
+    m.wt = pd.Series([1.0, 2.0, 1.0, 2.0, 3.0], index=idx)
+    recharge = m.estimate_recharge(sy=0.1)
+    assert len(recharge) == 3
+    assert (recharge.index == idx[[1, 3, 4]]).all()
+
+
+def test_estimate_recharge_after_inplace_edit():
+    idx = pd.date_range("2020-01-01", periods=6, freq="D")
+    m = Model(pd.Series([1.0, 2.0, 1.0, 2.0, 1.0, 2.0], index=idx))
+    m.estimate_recharge(sy=1.0)
+    m.wt.iloc[:] = [2.0, 1.0, 2.0, 1.0, 2.0, 1.0]
+    recharge = m.estimate_recharge(sy=1.0)
+    assert (recharge.index == idx[[2, 4]]).all()
+
+
+def test_plot_after_set_wt(simple_wt):
+    m = Model(simple_wt)
+    m.estimate_recharge(sy=0.1)
+    m.wt = simple_wt.iloc[:3]
+    assert m.events is None
+    assert m.rises is None
+    m.estimate_recharge(sy=0.1)
+    assert m.plot() is not None
+
+
+def test_events_and_rises_attributes(simple_wt):
+    m = Model(simple_wt)
+    assert m.events is None
+    assert m.rises is None
+
+    m.estimate_recharge(sy=0.1)
+    assert m.events is m.events
+    assert isinstance(m.rises, pd.Series)
+
+    # Setting the attributes is used by plot
+    m.rises = m.rises.iloc[:2]
+    m.events = m.rises.index
+    assert len(m.events) == 2
+    np.testing.assert_array_equal(m._rises.left_pos, [0, 1])
+    assert m.plot() is not None
+
+    m.events = None
+    assert m.events is None